@@ -1,9 +1,19 @@
 import os
-import json
+import orjson
 import logging
-import requests
+import asyncio
 import re
+import random
+import math
+import hashlib
+import functools
+from types import MappingProxyType
+import aiohttp
+import numpy as np
+from cachetools import TTLCache
+import diskcache
 from telegram import Update
+from telegram.error import TelegramError
 from telegram.ext import (
     ApplicationBuilder,
     ContextTypes,
@@ -11,7 +21,14 @@ from telegram.ext import (
     MessageHandler,
     filters
 )
-import openai
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+    wait_random_exponential
+)
 from dotenv import load_dotenv
 
 #Load environment variables
@@ -27,173 +44,560 @@ logger = logging.getLogger(__name__)
 #API Configuration
 COINBASE_API = "https://api.coinbase.com/v2/prices"
 COINGECKO_API = "https://api.coingecko.com/api/v3/simple/price"
-OPENAI_MODEL = "gpt-4-turbo"
+COINGECKO_CHART_API = "https://api.coingecko.com/api/v3/coins/{coin_id}/market_chart"
+INTENT_MODEL = os.getenv("INTENT_MODEL", "gpt-4o-mini")
+RESPONSE_MODEL = os.getenv("RESPONSE_MODEL", "gpt-4o-mini")
+#Used only when the intent model returns unusable JSON
+INTENT_FALLBACK_MODEL = os.getenv("INTENT_FALLBACK_MODEL", "gpt-4o")
+INTENTS = frozenset({"price", "convert", "trend", "error"})
+REPLY_EMOJIS = ("📈", "💰", "🚀", "🪙", "👀")
+STREAM_EDIT_INTERVAL = 1.0  #seconds between streamed message edits
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=7, connect=2)
+HTTP_RETRIES = 3
+HTTP_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+HTTP_HEADERS = {
+    "User-Agent": "CryptoOracleBot/1.0",
+    "Accept": "application/json"
+}
+HTTP_LIMIT_PER_HOST = 64
+REGEX_CONFIDENCE_THRESHOLD = 0.9
+#Send non-streaming chat completions over aiohttp instead of the SDK's httpx client
+USE_AIOHTTP_OAI = os.getenv("USE_AIOHTTP_OAI") == "1"
+OAI_HTTP_TIMEOUT = aiohttp.ClientTimeout(total=60, sock_connect=5)
 
-#System Prompts
-INTENT_PROMPT = """
-You are an intent classifier for a crypto assistant. Analyze the user's message and output JSON with:
-- intent: "price", "convert", "trend", or "error"
-- parameters: Extract relevant entities
+#Map common names to CoinGecko IDs
+COIN_MAPPING = MappingProxyType({
+    "BTC": "bitcoin",
+    "ETH": "ethereum",
+    "SOL": "solana",
+    "DOGE": "dogecoin",
+    "XRP": "ripple",
+    "ADA": "cardano",
+    "USD": "usd",
+    "USDT": "tether",
+    "USDC": "usd-coin"
+})
+#Assets priced directly in USD via Coinbase
+USD_ASSETS = frozenset({"USD", "USDT", "USDC"})
+
+#Precompiled patterns for the regex intent fast-path
+_SYMBOL_NAMES = 'BTC|ETH|SOL|BNB|XRP|ADA|DOGE'
+_SYMBOLS = f'({_SYMBOL_NAMES})'
+_PRICE_RE = re.compile(r'\b(price|worth|value)\b', re.IGNORECASE)
+_CONVERT_RE = re.compile(r'\b(convert|how much|equivalent)\b', re.IGNORECASE)
+_SYMBOL_RE = re.compile(rf'\b{_SYMBOLS}\b', re.IGNORECASE)
+_CONVERT_AMOUNT_RE = re.compile(
+    rf'(\d+(?:\.\d+)?)\s*{_SYMBOLS}\s+(?:to|in|into)\s+'
+    rf'({_SYMBOL_NAMES}|{"|".join(sorted(USD_ASSETS))})\b',
+    re.IGNORECASE
+)
+_TIMEFRAME_RE = re.compile(r'^\s*(\d+)\s*([a-zA-Z]+)\s*$')
+#Days per timeframe unit; a bare "m" is ambiguous (minutes or months) so it isn't accepted
+_TIMEFRAME_UNITS = MappingProxyType({
+    "min": 1 / 1440,
+    "h": 1 / 24,
+    "d": 1,
+    "w": 7,
+    "mo": 30,
+    "M": 30,
+    "y": 365
+})
+#Amounts or other currencies in a price question
+_QUALIFIER_RE = re.compile(r'\d|\b(in|to|vs)\b', re.IGNORECASE)
+#Timeframes, history, advice or forecasts: a bare lookup can't answer these
+_CONTEXT_RE = re.compile(
+    r'\b(last|week|month|year|yesterday|ago|was|were|will|trend|perform\w*|'
+    r'buy\w*|sell\w*|should|predict\w*|forecast\w*|worth it)\b',
+    re.IGNORECASE
+)
+
+#Short-lived caches so bursts of identical lookups share one HTTP call
+_spot_cache = TTLCache(maxsize=256, ttl=10)
+_conv_cache = TTLCache(maxsize=1024, ttl=60)
+_trend_cache = TTLCache(maxsize=256, ttl=300)
+_inflight = {}
+
+#Intent classifications keyed by normalized query text
+_intent_cache = TTLCache(maxsize=2048, ttl=3600)
+
+#Persistent intent classifications keyed by prompt hash, survives restarts.
+#Opened on first use; diskcache is synchronous SQLite, so only touch it
+#from a worker thread.
+@functools.lru_cache(maxsize=1)
+def _get_disk_cache():
+    return diskcache.Cache(os.getenv("OAI_CACHE_DIR", ".oai_cache"), size_limit=2**30)
+
+def _disk_get_intent(key: str):
+    """Look up a stored classification from either intent model"""
+    cache = _get_disk_cache()
+    for model in (INTENT_MODEL, INTENT_FALLBACK_MODEL):
+        intent_data = cache.get(_prompt_key(model, INTENT_PROMPT, key))
+        if intent_data is not None:
+            return intent_data
+    return None
+
+def _disk_set_intent(model: str, key: str, intent_data: dict):
+    _get_disk_cache().set(_prompt_key(model, INTENT_PROMPT, key), intent_data)
+
+#openai pulls in pydantic, httpx and friends, so it is imported on first use
+@functools.lru_cache(maxsize=1)
+def _openai():
+    import openai
+    return openai
+
+#Retries are handled by _chat_completion so they respect the semaphore
+@functools.lru_cache(maxsize=1)
+def _get_client():
+    """Async OpenAI client with an explicitly sized connection pool"""
+    import httpx
+    return _openai().AsyncOpenAI(
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        ),
+        max_retries=0
+    )
 
-Output ONLY JSON with these possible structures:
+def _warm_openai():
+    """Import openai and build the client ahead of the first message"""
+    try:
+        _get_client()
+    except Exception:
+        logger.exception("OpenAI client warm-up failed")
+
+#Caps in-flight OpenAI requests to stay within the account rate limit
+_openai_sem = asyncio.Semaphore(int(os.getenv("OPENAI_CONCURRENCY", "50")))
+
+async def _chat_completion(**kwargs):
+    """Create a chat completion, rate limited and retried with backoff"""
+    openai = _openai()
+    async for attempt in AsyncRetrying(
+        wait=wait_random_exponential(multiplier=1, max=30),
+        stop=stop_after_attempt(5),
+        retry=retry_if_exception_type(
+            (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
+        ),
+        reraise=True
+    ):
+        with attempt:
+            #Streams outlive create(), so stream_response holds the semaphore itself
+            if kwargs.get("stream"):
+                return await _get_client().chat.completions.create(**kwargs)
+            async with _openai_sem:
+                if USE_AIOHTTP_OAI:
+                    return await _post_chat(kwargs)
+                return await _get_client().chat.completions.create(**kwargs)
+
+_oai_session = None
+
+async def _post_chat(payload: dict):
+    """POST a chat completion with aiohttp, mirroring the SDK's return and exception types"""
+    global _oai_session
+    import httpx
+    from openai.types.chat import ChatCompletion
+    openai = _openai()
+    client = _get_client()
+    if _oai_session is None:
+        _oai_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=200, keepalive_timeout=60),
+            timeout=OAI_HTTP_TIMEOUT
+        )
+    url = f"{client.base_url}chat/completions"
+    try:
+        async with _oai_session.post(
+            url,
+            data=orjson.dumps(payload),
+            headers={
+                "Authorization": f"Bearer {client.api_key}",
+                "Content-Type": "application/json"
+            }
+        ) as response:
+            status = response.status
+            body = await response.read()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        raise openai.APIConnectionError(request=httpx.Request("POST", url)) from e
+    
+    if status >= 400:
+        try:
+            error_body = orjson.loads(body)
+        except ValueError:
+            error_body = body.decode(errors="replace")
+        if status == 429:
+            error_cls = openai.RateLimitError
+        elif status >= 500:
+            error_cls = openai.InternalServerError
+        else:
+            error_cls = openai.APIStatusError
+        raise error_cls(
+            f"Error code: {status} - {error_body}",
+            response=httpx.Response(status, content=body, request=httpx.Request("POST", url)),
+            body=error_body
+        )
+    return ChatCompletion.model_validate(orjson.loads(body))
+
+async def close_openai_session():
+    """Close the aiohttp session used for direct OpenAI calls, if any"""
+    global _oai_session
+    if _oai_session is not None:
+        await _oai_session.close()
+        _oai_session = None
+
+#System Prompts
+INTENT_PROMPT = """Classify the crypto question. Output ONLY one JSON object shaped like:
 {"intent": "price", "crypto_symbol": "BTC", "fiat_currency": "USD"}
 {"intent": "convert", "amount": 0.5, "from_asset": "ETH", "to_asset": "USD"}
 {"intent": "trend", "crypto_symbol": "SOL", "timeframe": "7d"}
 {"intent": "error", "reason": "message"}
-
-Rules:
-1. Default fiat: USD
-2. Default timeframe: 7d
-3. For price checks: Extract crypto symbol
-4. For conversions: Extract amount, from_asset, to_asset
-5. For trends: Extract crypto_symbol and timeframe
-6. If unsure, return error intent
-
-Examples:
-User: "What's bitcoin worth?" → {"intent": "price", "crypto_symbol": "BTC"}
-User: "Convert 1 ethereum to dollars" → {"intent": "convert", "amount": 1, "from_asset": "ETH", "to_asset": "USD"}
-User: "How did solana perform last month?" → {"intent": "trend", "crypto_symbol": "SOL", "timeframe": "30d"}
+Use ticker symbols. Timeframe units: min, h, d, w, mo, y. Defaults: USD, 7d. If unsure, use error.
+Add "ambiguous": true if answering needs more than the looked-up number.
 """
 
-#Natural conversation prompt
-RESPONSE_PROMPT = """
-You're a friendly crypto expert. Answer the user's question naturally and conversationally. Follow these guidelines:
+#Natural conversation prompt. Kept free of per-request data so every call
+#shares a byte-identical prefix for OpenAI's prompt caching.
+RESPONSE_PROMPT = """You're a friendly crypto expert. Answer in 1-2 casual sentences using the data in the next message. Format numbers clearly (e.g., $12,000.50), use at most one emoji, mention risk only for unusual volatility, and never use markdown or lists.
+"""
 
-1. Be concise (1-2 sentences maximum)
-2. Use everyday language, not financial jargon
-3. Format numbers clearly (e.g., $12,000.50)
-4. Only include risk warnings if there's unusual volatility
-5. Add personality with occasional emojis (max 1 per response)
-6. NEVER use markdown, bullet points, or numbered lists
+def _is_retryable_http_error(e: BaseException) -> bool:
+    """Transient failures worth retrying against Coinbase/CoinGecko"""
+    if isinstance(e, aiohttp.ClientResponseError):
+        return e.status in HTTP_RETRY_STATUSES
+    return isinstance(e, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
 
-Examples:
-User: "Price of BTC?"
-Good: "Bitcoin is currently trading at $61,200 - up 2% today!"
-Bad: "The current price of Bitcoin is $61,200. It has increased by 2% in the last 24 hours."
+class CryptoAPI:
+    def __init__(self, session: aiohttp.ClientSession):
+        self._session = session
+        #Keeps concurrent lookups within the per-host connection pool
+        self._semaphore = asyncio.Semaphore(HTTP_LIMIT_PER_HOST)
 
-User: "Convert 5 ETH to USD"
-Good: "5 Ethereum would be about $15,250 right now at $3,050 per ETH. Crypto prices move fast though!"
-Bad: "Converting 5 ETH to USD gives $15,250. The current exchange rate is $3,050 per ETH."
+    async def _cached(self, cache: TTLCache, key: tuple, fetch):
+        """Return a cached value, sharing a single in-flight fetch per key"""
+        if key in cache:
+            return cache[key]
+        task = _inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(fetch())
+            _inflight[key] = task
+            
+            def _done(t):
+                _inflight.pop(key, None)
+                if not t.cancelled() and t.exception() is None:
+                    cache[key] = t.result()
+            task.add_done_callback(_done)
+        #Shield so one cancelled caller doesn't cancel the fetch for the others
+        return await asyncio.shield(task)
 
-Data: {data}
-"""
+    async def _get_json(self, url: str, params: dict = None):
+        """GET a JSON document, retrying connection errors, timeouts and 429/5xx"""
+        async for attempt in AsyncRetrying(
+            wait=wait_exponential(multiplier=0.3),
+            stop=stop_after_attempt(HTTP_RETRIES + 1),
+            retry=retry_if_exception(_is_retryable_http_error),
+            reraise=True
+        ):
+            with attempt:
+                async with self._semaphore, self._session.get(
+                    url, params=params
+                ) as response:
+                    response.raise_for_status()
+                    return await response.json(loads=orjson.loads)
 
-class CryptoAPI:
-    @staticmethod
-    def get_spot_price(asset: str, currency: str = "USD") -> float:
+    async def get_spot_price(self, asset: str, currency: str = "USD") -> float:
         """Fetch current price from Coinbase"""
+        #Normalize asset symbols
+        asset = asset.upper()
+        currency = currency.upper()
+        return await self._cached(
+            _spot_cache,
+            ("spot", asset, currency),
+            lambda: self._fetch_spot_price(asset, currency)
+        )
+
+    async def _fetch_spot_price(self, asset: str, currency: str) -> float:
         try:
-            #Normalize asset symbols
-            asset = asset.upper()
-            currency = currency.upper()
-            
-            response = requests.get(
-                f"{COINBASE_API}/{asset}-{currency}/spot"
-            )
-            response.raise_for_status()
-            return float(response.json()["data"]["amount"])
-        except (requests.RequestException, KeyError, ValueError) as e:
+            data = await self._get_json(f"{COINBASE_API}/{asset}-{currency}/spot")
+            return float(data["data"]["amount"])
+        except (aiohttp.ClientError, asyncio.TimeoutError, KeyError, ValueError) as e:
             logger.error(f"Coinbase error: {e}")
             raise
 
-    @staticmethod
-    def get_conversion_rate(from_asset: str, to_asset: str) -> float:
+    async def get_conversion_rate(self, from_asset: str, to_asset: str) -> float:
         """Get conversion rate using CoinGecko"""
+        from_id = COIN_MAPPING.get(from_asset.upper(), from_asset.lower())
+        to_id = COIN_MAPPING.get(to_asset.upper(), to_asset.lower())
+        return await self._cached(
+            _conv_cache,
+            ("conv", from_id, to_id),
+            lambda: self._fetch_conversion_rate(from_id, to_id)
+        )
+
+    async def _fetch_conversion_rate(self, from_id: str, to_id: str) -> float:
         try:
-            #Map common names to CoinGecko IDs
-            coin_mapping = {
-                "BTC": "bitcoin",
-                "ETH": "ethereum",
-                "SOL": "solana",
-                "DOGE": "dogecoin",
-                "XRP": "ripple",
-                "ADA": "cardano",
-                "USD": "usd",
-                "USDT": "tether",
-                "USDC": "usd-coin"
-            }
-            
-            from_id = coin_mapping.get(from_asset.upper(), from_asset.lower())
-            to_id = coin_mapping.get(to_asset.upper(), to_asset.lower())
-            
             params = {
                 "ids": from_id,
                 "vs_currencies": to_id
             }
-            response = requests.get(COINGECKO_API, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = await self._get_json(COINGECKO_API, params=params)
             return data[from_id][to_id]
-        except (requests.RequestException, KeyError) as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError, KeyError) as e:
             logger.error(f"CoinGecko error: {e}")
             raise
 
-class OpenAIService:
-    @staticmethod
-    def classify_intent(query: str) -> dict:
-        """Classify user intent using GPT with robust error handling"""
+    async def get_trend(self, asset: str, timeframe: str = "7d") -> dict:
+        """Summarize price movement over a timeframe using CoinGecko history"""
+        asset = asset.upper()
+        coin_id = COIN_MAPPING.get(asset, asset.lower())
+        days = _timeframe_days(timeframe)
+        prices = await self._cached(
+            _trend_cache,
+            ("trend", coin_id, days),
+            lambda: self._fetch_price_history(coin_id, days)
+        )
+        #The JIT kernels may still be compiling, so keep them off the event loop
+        summary = await asyncio.to_thread(_summarize_prices, prices)
+        return {"asset": asset, "timeframe": timeframe, **summary}
+
+    async def _fetch_price_history(self, coin_id: str, days: int) -> np.ndarray:
         try:
-            response = openai.chat.completions.create(
-                model=OPENAI_MODEL,
-                messages=[
-                    {"role": "system", "content": INTENT_PROMPT},
-                    {"role": "user", "content": query}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.1
+            params = {
+                "vs_currency": "usd",
+                "days": days
+            }
+            data = await self._get_json(
+                COINGECKO_CHART_API.format(coin_id=coin_id), params=params
             )
-            return json.loads(response.choices[0].message.content)
-        except (openai.OpenAIError, json.JSONDecodeError) as e:
-            logger.error(f"Intent classification failed: {e}")
-            #Fallback: Simple regex-based intent detection
-            if re.search(r'\b(price|worth|value)\b', query, re.IGNORECASE):
-                symbols = re.findall(r'\b(BTC|ETH|SOL|BNB|XRP|ADA|DOGE)\b', query, re.IGNORECASE)
-                return {
-                    "intent": "price",
-                    "crypto_symbol": symbols[0] if symbols else "BTC"
-                }
-            elif re.search(r'\b(convert|how much|equivalent)\b', query, re.IGNORECASE):
-                return {"intent": "convert", "amount": 1, "from_asset": "ETH", "to_asset": "USD"}
-            return {"intent": "error", "reason": "Classification failed"}
+            prices = np.asarray([point[1] for point in data["prices"]], dtype=np.float64)
+            if len(prices) < 2:
+                raise ValueError(f"Not enough price history for {coin_id}")
+            return prices
+        except (aiohttp.ClientError, asyncio.TimeoutError, KeyError, ValueError) as e:
+            logger.error(f"CoinGecko error: {e}")
+            raise
+
+#numba/llvmlite are slow to import, so indicators is loaded on first use
+@functools.lru_cache(maxsize=1)
+def _indicators():
+    import indicators
+    return indicators
+
+def _summarize_prices(prices: np.ndarray) -> dict:
+    """Price change, moving averages and volatility over a price history"""
+    indicators = _indicators()
+    window = max(1, len(prices) // 4)
+    period_returns = indicators.returns(prices)
+    return {
+        "price": float(prices[-1]),
+        "change_pct": float((prices[-1] / prices[0] - 1.0) * 100),
+        "sma": float(indicators.sma(prices, window)[-1]),
+        "ema": float(indicators.ema(prices, window)[-1]),
+        "volatility_pct": float(np.std(period_returns) * 100) if len(period_returns) else 0.0
+    }
+
+def _warm_indicators():
+    """Import and JIT-compile the trend kernels ahead of the first trend query"""
+    try:
+        _summarize_prices(np.array([1.0, 2.0]))
+    except Exception:
+        logger.exception("Indicator warm-up failed")
+
+def _timeframe_days(timeframe: str) -> int:
+    """Convert a timeframe like "24h", "7d", "3mo" or "1y" to whole days, defaulting to 7"""
+    match = _TIMEFRAME_RE.match(timeframe or "")
+    if not match:
+        return 7
+    unit = match.group(2)
+    if unit not in _TIMEFRAME_UNITS and unit != "m":
+        unit = unit.lower()
+    if unit not in _TIMEFRAME_UNITS:
+        return 7
+    return max(1, round(int(match.group(1)) * _TIMEFRAME_UNITS[unit]))
+
+def _regex_classify(query: str) -> tuple:
+    """Cheap regex-based intent detection, returns (intent_data, confidence)"""
+    #Fully specified conversions, e.g. "convert 0.5 ETH to USD"
+    match = _CONVERT_AMOUNT_RE.search(query)
+    if match:
+        return {
+            "intent": "convert",
+            "amount": float(match.group(1)),
+            "from_asset": match.group(2).upper(),
+            "to_asset": match.group(3).upper()
+        }, 0.5 if _CONTEXT_RE.search(query) else 1.0
+    if _PRICE_RE.search(query):
+        symbols = _SYMBOL_RE.findall(query)
+        #Amounts, other currencies, timeframes or advice need the LLM
+        qualified = _QUALIFIER_RE.search(query) or _CONTEXT_RE.search(query)
+        confidence = 0.9 if len({sym.upper() for sym in symbols}) == 1 and not qualified else 0.5
+        return {
+            "intent": "price",
+            "crypto_symbol": symbols[0].upper() if symbols else "BTC"
+        }, confidence
+    elif _CONVERT_RE.search(query):
+        return {"intent": "convert", "amount": 1, "from_asset": "ETH", "to_asset": "USD"}, 0.3
+    return {"intent": "error", "reason": "Classification failed"}, 0.0
+
+def _format_money(value: float, currency: str) -> str:
+    if currency.upper() in USD_ASSETS:
+        if value >= 1 or value <= 0:
+            return f"${value:,.2f}"
+        #Sub-dollar assets need four significant digits, not cents
+        return f"${value:.{3 - math.floor(math.log10(value))}f}"
+    return f"{value:,.8g} {currency.upper()}"
+
+def _format_price(data: dict) -> str:
+    """Templated answer for a price lookup"""
+    price = _format_money(data["price"], data.get("currency", "USD"))
+    return f"{data.get('asset', 'Crypto')} is currently trading at {price} {random.choice(REPLY_EMOJIS)}"
+
+def _format_convert(data: dict) -> str:
+    """Templated answer for a conversion"""
+    result = _format_money(data["result"], data["to"])
+    return (
+        f"{data['amount']:g} {data['from']} is about {result} right now "
+        f"{random.choice(REPLY_EMOJIS)}"
+    )
+
+def _format_trend(data: dict) -> str:
+    """Templated answer for a trend summary"""
+    direction = "up" if data["change_pct"] >= 0 else "down"
+    return (
+        f"{data['asset']} is {direction} {abs(data['change_pct']):.1f}% over the last "
+        f"{data['timeframe']}, now at {_format_money(data['price'], 'USD')} "
+        f"{random.choice(REPLY_EMOJIS)}"
+    )
 
+def _normalize_query(query: str) -> str:
+    """Lowercase and collapse whitespace so trivially different queries match"""
+    return " ".join(query.lower().split())
+
+def _prompt_key(model: str, system: str, user: str) -> str:
+    """Stable cache key for an OpenAI prompt"""
+    return hashlib.sha256(f"{model}\0{system}\0{user}".encode()).hexdigest()
+
+def _response_messages(query: str, data: dict) -> list:
+    """Static system prompt first, then the lookup data and the user's question"""
+    return [
+        {"role": "system", "content": RESPONSE_PROMPT},
+        {"role": "system", "content": orjson.dumps(data).decode()},
+        {"role": "user", "content": query}
+    ]
+
+class OpenAIService:
     @staticmethod
-    def generate_response(query: str, data: dict) -> str:
-        """Generate natural language response"""
-        try:
-            system_content = RESPONSE_PROMPT.format(data=json.dumps(data))
-            
-            response = openai.chat.completions.create(
-                model=OPENAI_MODEL,
-                messages=[
-                    {"role": "system", "content": system_content},
-                    {"role": "user", "content": query}
-                ],
-                temperature=0.8
+    async def classify_intent(query: str) -> dict:
+        """Classify user intent, only calling GPT when the regex fast-path is unsure"""
+        guess, confidence = _regex_classify(query)
+        if confidence >= REGEX_CONFIDENCE_THRESHOLD:
+            return guess
+        
+        key = _normalize_query(query)
+        if key in _intent_cache:
+            return dict(_intent_cache[key])
+        intent_data = await asyncio.to_thread(_disk_get_intent, key)
+        if intent_data is not None:
+            _intent_cache[key] = intent_data
+            return dict(intent_data)
+        for model in (INTENT_MODEL, INTENT_FALLBACK_MODEL):
+            try:
+                response = await _chat_completion(
+                    model=model,
+                    messages=[
+                        {"role": "system", "content": INTENT_PROMPT},
+                        {"role": "user", "content": query}
+                    ],
+                    response_format={"type": "json_object"},
+                    temperature=0.1
+                )
+                intent_data = orjson.loads(response.choices[0].message.content)
+            except _openai().OpenAIError as e:
+                logger.error(f"Intent classification failed: {e}")
+                break
+            except orjson.JSONDecodeError as e:
+                logger.warning(f"{model} returned invalid JSON: {e}")
+                continue
+            if isinstance(intent_data, dict) and intent_data.get("intent") in INTENTS:
+                _intent_cache[key] = intent_data
+                await asyncio.to_thread(_disk_set_intent, model, key, intent_data)
+                return dict(intent_data)
+            logger.warning(f"{model} returned unexpected intent: {intent_data}")
+        #Fallback: Simple regex-based intent detection
+        return guess
+
+    @staticmethod
+    async def stream_response(query: str, data: dict):
+        """Generate natural language response, yielding text as it arrives"""
+        #Errors propagate so reply_streaming can replace any partial answer
+        #Hold a concurrency slot until the whole stream has been read
+        async with _openai_sem:
+            stream = await _chat_completion(
+                model=RESPONSE_MODEL,
+                messages=_response_messages(query, data),
+                temperature=0.8,
+                stream=True
             )
-            return response.choices[0].message.content
-        except openai.OpenAIError as e:
-            logger.error(f"Response generation failed: {e}")
-            #Fallback with natural language
-            if 'price' in data:
-                return f"{data.get('asset', 'Crypto')} is currently at ${data['price']:,.2f}"
-            elif 'result' in data:
-                return f"{data['amount']} {data['from']} ≈ {data['result']:,.2f} {data['to']}"
-            return "Having trouble checking prices right now. Try again in a minute!"
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+    @staticmethod
+    def fallback_response(data: dict) -> str:
+        """Fallback with natural language"""
+        if 'change_pct' in data:
+            return _format_trend(data)
+        elif 'price' in data:
+            return _format_price(data)
+        elif 'result' in data:
+            return _format_convert(data)
+        return "Having trouble checking prices right now. Try again in a minute!"
 
 class CryptoOracleBot:
     def __init__(self):
-        self.api = CryptoAPI()
+        self.session = None
+        self.api = None
+        self._warmups = []
         self.ai = OpenAIService()
 
+    async def post_init(self, application):
+        """Open the shared HTTP session once the event loop is running"""
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit_per_host=HTTP_LIMIT_PER_HOST,
+                keepalive_timeout=60
+            ),
+            timeout=HTTP_TIMEOUT,
+            headers=HTTP_HEADERS
+        )
+        self.api = CryptoAPI(self.session)
+        #Warm the OpenAI import in the background so startup doesn't wait on it
+        #and the first user usually doesn't pay for it either
+        self._warmups.append(asyncio.create_task(asyncio.to_thread(_warm_openai)))
+        #Compile the trend kernels in the background; startup doesn't wait on it
+        self._warmups.append(asyncio.create_task(asyncio.to_thread(_warm_indicators)))
+
+    async def post_shutdown(self, application):
+        """Close the shared HTTP sessions"""
+        if self.session is not None:
+            await self.session.close()
+        await close_openai_session()
+
     async def handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Main message handler with improved intent handling"""
         user_query = update.message.text
         user = update.effective_user
         logger.info(f"User {user.id}: {user_query}")
         
+        #Speculatively fetch the price while the intent is being classified
+        guess, _ = _regex_classify(user_query)
+        price_task = None
+        if guess["intent"] == "price":
+            price_task = asyncio.create_task(
+                self.api.get_spot_price(guess["crypto_symbol"], "USD")
+            )
+            #Errors are logged by CryptoAPI; don't warn about unretrieved ones
+            price_task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        
+        data = None
         try:
             #Classify intent
-            intent_data = self.ai.classify_intent(user_query)
+            intent_data = await self.ai.classify_intent(user_query)
             intent = intent_data.get("intent", "error")
             logger.info(f"Classified intent: {intent_data}")
             
@@ -201,11 +605,15 @@ class CryptoOracleBot:
             if intent == "price":
                 asset = intent_data.get("crypto_symbol", "BTC")
                 currency = intent_data.get("fiat_currency", "USD")
-                price = self.api.get_spot_price(asset, currency)
-                response = self.ai.generate_response(
-                    user_query,
-                    {"price": price, "asset": asset, "currency": currency}
-                )
+                if (
+                    price_task is not None
+                    and asset.upper() == guess["crypto_symbol"].upper()
+                    and currency.upper() == "USD"
+                ):
+                    price = await price_task
+                else:
+                    price = await self.api.get_spot_price(asset, currency)
+                data = {"price": price, "asset": asset, "currency": currency}
                 
             elif intent == "convert":
                 amount = float(intent_data.get("amount", 1))
@@ -213,22 +621,24 @@ class CryptoOracleBot:
                 to_asset = intent_data.get("to_asset", "USD")
                 
                 #Special case for fiat conversions
-                if to_asset.upper() in ["USD", "USDT", "USDC"]:
-                    rate = self.api.get_spot_price(from_asset, "USD")
+                if to_asset.upper() in USD_ASSETS:
+                    rate = await self.api.get_spot_price(from_asset, "USD")
                 else:
-                    rate = self.api.get_conversion_rate(from_asset, to_asset)
+                    rate = await self.api.get_conversion_rate(from_asset, to_asset)
                     
                 converted = amount * rate
-                response = self.ai.generate_response(
-                    user_query,
-                    {
-                        "amount": amount, 
-                        "from": from_asset, 
-                        "to": to_asset, 
-                        "result": converted,
-                        "rate": rate
-                    }
-                )
+                data = {
+                    "amount": amount, 
+                    "from": from_asset, 
+                    "to": to_asset, 
+                    "result": converted,
+                    "rate": rate
+                }
+                
+            elif intent == "trend":
+                asset = intent_data.get("crypto_symbol", "BTC")
+                timeframe = intent_data.get("timeframe", "7d")
+                data = await self.api.get_trend(asset, timeframe)
                 
             else:
                 #Handle errors and unknown intents
@@ -241,14 +651,62 @@ class CryptoOracleBot:
         except Exception as e:
             logger.exception("Processing error")
             response = f"Oops! Ran into an issue: {str(e)}. Try asking differently?"
+        finally:
+            if price_task is not None:
+                price_task.cancel()
         
-        await update.message.reply_text(response)
+        if data is not None:
+            #Plain lookups get a templated answer; the LLM is reserved for
+            #ambiguous questions or users who asked for /verbose replies
+            if intent_data.get("ambiguous") or context.user_data.get("verbose"):
+                await self.reply_streaming(update, user_query, data)
+            elif intent == "trend":
+                await update.message.reply_text(_format_trend(data))
+            elif intent == "price":
+                await update.message.reply_text(_format_price(data))
+            else:
+                await update.message.reply_text(_format_convert(data))
+        else:
+            await update.message.reply_text(response)
+
+    async def reply_streaming(self, update: Update, query: str, data: dict):
+        """Send a placeholder reply and progressively edit in the streamed answer"""
+        message = await update.message.reply_text("…")
+        loop = asyncio.get_running_loop()
+        text = sent = ""
+        last_edit = loop.time()
+        try:
+            async for delta in self.ai.stream_response(query, data):
+                text += delta
+                #Telegram allows roughly one edit per second per chat
+                if loop.time() - last_edit >= STREAM_EDIT_INTERVAL and text.strip():
+                    await message.edit_text(text)
+                    sent = text
+                    last_edit = loop.time()
+        except Exception:
+            logger.exception("Streaming reply failed")
+            #Replace any truncated answer with the templated one
+            text = ""
+        if not text.strip():
+            text = self.ai.fallback_response(data)
+        if text != sent:
+            try:
+                await message.edit_text(text)
+            except TelegramError:
+                logger.exception("Final reply edit failed")
+                await update.message.reply_text(text)
 
 #Bot Initialization
 def main():
-    application = ApplicationBuilder().token(os.getenv("TELEGRAM_TOKEN")).build()
-    
     bot = CryptoOracleBot()
+    application = (
+        ApplicationBuilder()
+        .token(os.getenv("TELEGRAM_TOKEN"))
+        .post_init(bot.post_init)
+        .post_shutdown(bot.post_shutdown)
+        .build()
+    )
+    
     application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, bot.handle_message))
     
     #Start command handler
@@ -257,7 +715,8 @@ def main():
             "Hi! I'm your Crypto Oracle. Ask me things like:\n"
             "• \"What's Bitcoin worth?\"\n"
             "• \"Convert 0.5 ETH to USD\"\n"
-            "• \"SOL price\"\n\n"
+            "• \"SOL price\"\n"
+            "• \"How did ETH do this week?\"\n\n"
             "I'll give you quick, friendly answers!"
         )
     
@@ -269,12 +728,38 @@ def main():
             "Just ask naturally! Examples:\n"
             "\"What's Ethereum worth?\"\n"
             "\"Convert 1 Bitcoin to US dollars\"\n"
-            "\"Price of Solana\"\n\n"
-            "I support: BTC, ETH, SOL, XRP, ADA, DOGE"
+            "\"Price of Solana\"\n"
+            "\"How did Bitcoin perform last month?\"\n\n"
+            "I support: BTC, ETH, SOL, XRP, ADA, DOGE\n"
+            "Send /verbose to toggle chattier answers"
         )
     
     application.add_handler(CommandHandler("help", help_cmd))
-    application.run_polling()
+    
+    #Verbose command handler
+    async def verbose(update: Update, context: ContextTypes.DEFAULT_TYPE):
+        context.user_data["verbose"] = not context.user_data.get("verbose", False)
+        await update.message.reply_text(
+            "Chatty mode on! I'll explain things in my own words."
+            if context.user_data["verbose"]
+            else "Chatty mode off. Back to quick answers!"
+        )
+    
+    application.add_handler(CommandHandler("verbose", verbose))
+    
+    #Telegram pushes updates to us when a public host is configured;
+    #polling is kept as the local development fallback
+    public_host = os.getenv("PUBLIC_HOST")
+    if public_host:
+        token = os.getenv("TELEGRAM_TOKEN")
+        application.run_webhook(
+            listen="0.0.0.0",
+            port=int(os.getenv("PORT", 8443)),
+            url_path=token,
+            webhook_url=f"https://{public_host}/{token}"
+        )
+    else:
+        application.run_polling()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
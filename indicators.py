@@ -0,0 +1,37 @@
+import numpy as np
+from numba import njit
+
+#Kernels are compiled on first call; cache=True keeps the machine code on
+#disk so later bot restarts skip the compile step
+
+@njit(cache=True, fastmath=True)
+def returns(prices: np.ndarray) -> np.ndarray:
+    """Simple period-over-period returns"""
+    out = np.empty(prices.shape[0] - 1)
+    for i in range(1, prices.shape[0]):
+        out[i - 1] = prices[i] / prices[i - 1] - 1.0
+    return out
+
+@njit(cache=True, fastmath=True)
+def sma(prices: np.ndarray, window: int) -> np.ndarray:
+    """Simple moving average over a sliding window"""
+    n = prices.shape[0] - window + 1
+    out = np.empty(n)
+    total = 0.0
+    for i in range(window):
+        total += prices[i]
+    out[0] = total / window
+    for i in range(1, n):
+        total += prices[i + window - 1] - prices[i - 1]
+        out[i] = total / window
+    return out
+
+@njit(cache=True, fastmath=True)
+def ema(prices: np.ndarray, span: int) -> np.ndarray:
+    """Exponential moving average with smoothing 2 / (span + 1)"""
+    alpha = 2.0 / (span + 1.0)
+    out = np.empty(prices.shape[0])
+    out[0] = prices[0]
+    for i in range(1, prices.shape[0]):
+        out[i] = alpha * prices[i] + (1.0 - alpha) * out[i - 1]
+    return out